@@ -4,23 +4,16 @@ A Streamlit web application to analyze and recommend credit cards
 based on user salary, spending habits, and preferences.
 """
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from data.credit_cards import get_all_cards, POINT_VALUATION
-from utils.calculator import rank_cards, calculate_total_spend
-
-# Page configuration
-st.set_page_config(
-    page_title="Best Credit Card Guide - India",
-    page_icon="💳",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
+from data.credit_cards import CATEGORIES, get_all_cards, POINT_VALUATION
+from utils.calculator import CardAnalysis, rank_cards, score_cards, calculate_total_spend
 
 # Custom CSS for better styling
-st.markdown("""
+_CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -54,7 +47,49 @@ st.markdown("""
         border-radius: 0.5rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Chart colors per bank
+_BANK_COLORS = {
+    "HDFC": "#004C8F",
+    "SBI": "#22409A",
+    "Axis": "#97144D",
+    "ICICI": "#F58220",
+    "Amex": "#006FCF",
+    "RBL": "#E31837",
+    "IndusInd": "#98002E",
+}
+
+# Display formatters for the numeric comparison table columns
+_TABLE_FORMATTERS = {
+    "Annual Fee": "₹{:,}".format,
+    "Effective Fee": "₹{:,}".format,
+    "Net Benefit": "₹{:,.0f}".format,
+    "Reward Rate": "{:.2f}%".format,
+}
+
+# Three-column layout for a card's detailed breakdown tab
+_BREAKDOWN_HTML = """<div style="display: flex; gap: 1.5rem; flex-wrap: wrap;">
+<div style="flex: 1; min-width: 14rem;"><p><strong>💵 Fee Structure</strong></p>{fee_lines}</div>
+<div style="flex: 1; min-width: 14rem;"><p><strong>🎁 Rewards Earned</strong></p>{reward_lines}</div>
+<div style="flex: 1; min-width: 14rem;"><p><strong>🎯 Milestones &amp; Extras</strong></p>{extra_lines}</div>
+</div>"""
+
+# Page configuration
+st.set_page_config(
+    page_title="Best Credit Card Guide - India",
+    page_icon="💳",
+    layout="wide",
+    initial_sidebar_state="expanded",
+)
+
+# Inject custom CSS
+st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+
+def _html_lines(lines: list) -> str:
+    """Render text lines as paragraphs for the breakdown HTML template"""
+    return "".join(f'<p style="margin: 0.25rem 0;">{line}</p>' for line in lines)
 
 
 def format_currency(amount: float) -> str:
@@ -67,6 +102,52 @@ def format_currency(amount: float) -> str:
         return f"₹{amount:,.0f}"
 
 
+_format_rupees = np.frompyfunc("{:,.0f}".format, 1, 1)
+
+
+def format_currency_array(amounts) -> np.ndarray:
+    """Format a whole array of amounts like format_currency, in one pass"""
+    amounts = np.asarray(amounts, dtype=np.float64)
+    is_lakh = amounts >= 100000
+    is_thousand = amounts >= 1000
+    
+    scaled = np.select([is_lakh, is_thousand], [amounts / 100000, amounts / 1000], amounts)
+    digits = np.where(
+        is_thousand,
+        np.char.mod("%.1f", scaled),
+        _format_rupees(scaled).astype(str),
+    )
+    suffix = np.select([is_lakh, is_thousand], ["L", "K"], "")
+    
+    return np.char.add(np.char.add("₹", digits), suffix)
+
+
+@st.cache_data(ttl=3600, max_entries=256)
+def _cached_scores(spend_vector: tuple, is_first_year: bool) -> dict:
+    """Memoized score_cards; independent of salary and preference filters"""
+    return score_cards(get_all_cards(), spend_vector, is_first_year)
+
+
+@st.cache_data(ttl=3600, max_entries=256)
+def _cached_rank(
+    monthly_salary: int,
+    spend_vector: tuple,
+    needs_lounge: bool,
+    lifetime_free_only: bool,
+    is_first_year: bool,
+) -> list:
+    """Memoized rank_cards; spend_vector holds the monthly spends in CATEGORIES order"""
+    return rank_cards(
+        cards=get_all_cards(),
+        monthly_salary=monthly_salary,
+        monthly_spends=spend_vector,
+        needs_lounge=needs_lounge,
+        lifetime_free_only=lifetime_free_only,
+        is_first_year=is_first_year,
+        scores=_cached_scores(spend_vector, is_first_year),
+    )
+
+
 def create_sidebar():
     """Create the sidebar with user inputs"""
     st.sidebar.markdown("## 👤 Your Profile")
@@ -163,7 +244,7 @@ def create_sidebar():
     return monthly_salary, monthly_spends, needs_lounge, lifetime_free_only, is_first_year
 
 
-def display_winner_card(winner: dict):
+def display_winner_card(winner: CardAnalysis):
     """Display the top recommended card with details"""
     st.markdown("### 🏆 Top Recommendation")
     
@@ -173,49 +254,55 @@ def display_winner_card(winner: dict):
         st.markdown(f"""
         <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%); 
                     padding: 1.5rem; border-radius: 1rem; color: white;">
-            <h2 style="margin: 0; color: white;">{winner['card_name']}</h2>
-            <p style="margin: 0.5rem 0; opacity: 0.9;">{winner['bank']} • {winner['card_type']}</p>
-            <h3 style="margin: 1rem 0 0.5rem 0; color: white;">Net Annual Benefit: ₹{winner['net_value']:,.0f}</h3>
+            <h2 style="margin: 0; color: white;">{winner.card_name}</h2>
+            <p style="margin: 0.5rem 0; opacity: 0.9;">{winner.bank} • {winner.card_type}</p>
+            <h3 style="margin: 1rem 0 0.5rem 0; color: white;">Net Annual Benefit: ₹{winner.net_value:,.0f}</h3>
             <p style="margin: 0; font-size: 0.9rem; opacity: 0.9;">
-                Effective Reward Rate: {winner['effective_reward_rate']:.2f}%
+                Effective Reward Rate: {winner.effective_reward_rate:.2f}%
             </p>
         </div>
         """, unsafe_allow_html=True)
         
-        st.markdown(f"**📝 Why this card?** {winner['why_recommended']}")
-        st.markdown(f"*{winner['description']}*")
+        st.markdown(f"**📝 Why this card?** {winner.why_recommended}")
+        st.markdown(f"*{winner.description}*")
     
     with col2:
-        breakdown = winner['breakdown']
-        st.metric("💰 Total Rewards", f"₹{breakdown['total_rewards']:,.0f}")
-        st.metric("🎯 Milestone Bonus", f"₹{breakdown['milestone_value']:,.0f}")
+        breakdown = winner.breakdown
+        st.metric("💰 Total Rewards", f"₹{breakdown.total_rewards:,.0f}")
+        st.metric("🎯 Milestone Bonus", f"₹{breakdown.milestone_value:,.0f}")
         
-        if breakdown['fee_waived']:
+        if breakdown.fee_waived:
             st.metric("📋 Annual Fee", "₹0 (Waived)", delta="Waived!")
         else:
-            st.metric("📋 Annual Fee", f"₹{breakdown['effective_fee']:,}")
+            st.metric("📋 Annual Fee", f"₹{breakdown.effective_fee:,}")
         
-        if breakdown['lounge_value'] > 0:
-            st.metric("🛋️ Lounge Value", f"₹{breakdown['lounge_value']:,.0f}")
+        if breakdown.lounge_value > 0:
+            st.metric("🛋️ Lounge Value", f"₹{breakdown.lounge_value:,.0f}")
 
 
 def display_comparison_table(results: list):
     """Display comparison table for all eligible cards"""
     st.markdown("### 📊 Card Comparison Table")
     
-    table_data = []
-    for r in results:
-        table_data.append({
-            "Card Name": r['card_name'],
-            "Bank": r['bank'],
-            "Annual Fee": f"₹{r['breakdown']['annual_fee']:,}",
-            "Effective Fee": f"₹{r['breakdown']['effective_fee']:,}" if not r['breakdown']['fee_waived'] else "₹0 ✓",
-            "Net Benefit": f"₹{r['net_value']:,.0f}",
-            "Reward Rate": f"{r['effective_reward_rate']:.2f}%",
-            "Lounge Access": r['lounge_access'] if r['lounge_access'] != "None" else "❌",
-        })
+    breakdowns = [r.breakdown for r in results]
+    fee_waived = np.array([b.fee_waived for b in breakdowns], dtype=bool)
+    
+    df = pd.DataFrame({
+        "Card Name": [r.card_name for r in results],
+        "Bank": [r.bank for r in results],
+        "Annual Fee": [b.annual_fee for b in breakdowns],
+        "Effective Fee": [b.effective_fee for b in breakdowns],
+        "Net Benefit": [r.net_value for r in results],
+        "Reward Rate": [r.effective_reward_rate for r in results],
+        "Lounge Access": [r.lounge_access for r in results],
+    })
     
-    df = pd.DataFrame(table_data)
+    # Format each numeric column with one bound formatter over the column
+    for column, formatter in _TABLE_FORMATTERS.items():
+        df[column] = df[column].map(formatter)
+    
+    df["Effective Fee"] = np.where(fee_waived, "₹0 ✓", df["Effective Fee"])
+    df["Lounge Access"] = df["Lounge Access"].replace("None", "❌")
     
     # Style the dataframe
     st.dataframe(
@@ -229,37 +316,19 @@ def display_comparison_table(results: list):
     )
 
 
-def display_chart(results: list):
-    """Display bar chart comparing net values"""
-    st.markdown("### 📈 Visual Comparison")
-    
-    # Prepare data for chart
-    chart_data = pd.DataFrame([
-        {
-            "Card": f"{r['card_name']}\n({r['bank']})",
-            "Net Benefit (₹)": r['net_value'],
-            "Bank": r['bank'],
-        }
-        for r in results[:8]  # Top 8 cards
-    ])
-    
-    # Create color scale based on bank
-    colors = {
-        "HDFC": "#004C8F",
-        "SBI": "#22409A",
-        "Axis": "#97144D",
-        "ICICI": "#F58220",
-        "Amex": "#006FCF",
-        "RBL": "#E31837",
-        "IndusInd": "#98002E",
-    }
+@st.cache_data(ttl=3600, max_entries=128)
+def _build_chart(top_cards: tuple) -> go.Figure:
+    """Build the net value bar chart from (label, net value, bank) rows"""
+    chart_data = pd.DataFrame(
+        list(top_cards), columns=["Card", "Net Benefit (₹)", "Bank"]
+    )
     
     fig = px.bar(
         chart_data,
         x="Card",
         y="Net Benefit (₹)",
         color="Bank",
-        color_discrete_map=colors,
+        color_discrete_map=_BANK_COLORS,
         title="Net Annual Benefit by Card",
     )
     
@@ -276,6 +345,19 @@ def display_chart(results: list):
         textposition='outside',
     )
     
+    return fig
+
+
+def display_chart(results: list):
+    """Display bar chart comparing net values"""
+    st.markdown("### 📈 Visual Comparison")
+    
+    # The figure is cached on the top 8 cards only
+    fig = _build_chart(tuple(
+        (f"{r.card_name}\n({r.bank})", r.net_value, r.bank)
+        for r in results[:8]
+    ))
+    
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -283,45 +365,44 @@ def display_detailed_breakdown(results: list):
     """Display detailed breakdown for top cards"""
     st.markdown("### 🔍 Detailed Analysis")
     
-    tabs = st.tabs([f"#{i+1} {r['card_name']}" for i, r in enumerate(results[:5])])
+    tabs = st.tabs([f"#{i+1} {r.card_name}" for i, r in enumerate(results[:5])])
     
     for i, tab in enumerate(tabs):
         with tab:
             result = results[i]
-            breakdown = result['breakdown']
+            breakdown = result.breakdown
+            
+            fee_lines = [f"Annual Fee: ₹{breakdown.annual_fee:,}"]
+            if breakdown.fee_waived:
+                fee_lines.append("✅ Fee Waived (spending threshold met)")
+            elif breakdown.annual_fee == 0:
+                fee_lines.append("✅ Lifetime Free Card")
+            else:
+                fee_lines.append(f"❌ Fee Applies: ₹{breakdown.effective_fee:,}")
             
-            col1, col2, col3 = st.columns(3)
+            reward_lines = [
+                f"{category.title()}: ₹{value:,.0f}"
+                for category, value in breakdown.category_rewards
+                if value > 0
+            ]
+            reward_lines.append(f"<strong>Total: ₹{breakdown.total_rewards:,.0f}</strong>")
             
-            with col1:
-                st.markdown("**💵 Fee Structure**")
-                st.write(f"Annual Fee: ₹{breakdown['annual_fee']:,}")
-                if breakdown['fee_waived']:
-                    st.write("✅ Fee Waived (spending threshold met)")
-                elif breakdown['annual_fee'] == 0:
-                    st.write("✅ Lifetime Free Card")
-                else:
-                    st.write(f"❌ Fee Applies: ₹{breakdown['effective_fee']:,}")
+            extra_lines = [f"✅ {milestone}" for milestone in breakdown.achieved_milestones]
+            if not extra_lines:
+                extra_lines.append("No milestones achieved")
             
-            with col2:
-                st.markdown("**🎁 Rewards Earned**")
-                for category, value in breakdown['category_rewards'].items():
-                    if value > 0:
-                        st.write(f"{category.title()}: ₹{value:,.0f}")
-                st.write(f"**Total: ₹{breakdown['total_rewards']:,.0f}**")
+            if breakdown.lounge_value > 0:
+                extra_lines.append(f"🛋️ Lounge Value: ₹{breakdown.lounge_value:,.0f}")
             
-            with col3:
-                st.markdown("**🎯 Milestones & Extras**")
-                if breakdown['achieved_milestones']:
-                    for milestone in breakdown['achieved_milestones']:
-                        st.write(f"✅ {milestone}")
-                else:
-                    st.write("No milestones achieved")
-                
-                if breakdown['lounge_value'] > 0:
-                    st.write(f"🛋️ Lounge Value: ₹{breakdown['lounge_value']:,.0f}")
-                
-                if breakdown['welcome_value'] > 0:
-                    st.write(f"🎁 Welcome Benefit: ₹{breakdown['welcome_value']:,.0f}")
+            if breakdown.welcome_value > 0:
+                extra_lines.append(f"🎁 Welcome Benefit: ₹{breakdown.welcome_value:,.0f}")
+            
+            # One markdown element per tab instead of a widget per line
+            st.markdown(_BREAKDOWN_HTML.format(
+                fee_lines=_html_lines(fee_lines),
+                reward_lines=_html_lines(reward_lines),
+                extra_lines=_html_lines(extra_lines),
+            ), unsafe_allow_html=True)
 
 
 def display_spend_summary(monthly_spends: dict):
@@ -341,20 +422,25 @@ def display_spend_summary(monthly_spends: dict):
         "utilities": "💡",
     }
     
+    # Annual figures for every category plus the total, formatted together
+    annual_labels = format_currency_array(
+        [amount * 12 for amount in monthly_spends.values()] + [total_annual]
+    )
+    
     for i, (category, amount) in enumerate(monthly_spends.items()):
         with cols[i]:
             icon = icons.get(category, "💰")
             st.metric(
                 f"{icon} {category.title()}",
                 f"₹{amount:,}/mo",
-                f"₹{amount*12:,}/yr",
+                f"{annual_labels[i]}/yr",
             )
     
     with cols[-1]:
         st.metric(
             "📊 Total",
             f"₹{total_monthly:,}/mo",
-            f"₹{total_annual:,}/yr",
+            f"{annual_labels[-1]}/yr",
         )
 
 
@@ -367,16 +453,16 @@ def main():
     # Get user inputs from sidebar
     monthly_salary, monthly_spends, needs_lounge, lifetime_free_only, is_first_year = create_sidebar()
     
-    # Get all cards and calculate rankings
-    all_cards = get_all_cards()
+    # Calculate rankings (cached on the user inputs); the calculator takes
+    # spends as a vector in CATEGORIES order, the dict stays in the UI layer
+    spend_vector = tuple(monthly_spends[category] for category in CATEGORIES)
     
-    results = rank_cards(
-        cards=all_cards,
-        monthly_salary=monthly_salary,
-        monthly_spends=monthly_spends,
-        needs_lounge=needs_lounge,
-        lifetime_free_only=lifetime_free_only,
-        is_first_year=is_first_year,
+    results = _cached_rank(
+        monthly_salary,
+        spend_vector,
+        needs_lounge,
+        lifetime_free_only,
+        is_first_year,
     )
     
     # Display spend summary
@@ -396,15 +482,14 @@ def main():
         Try adjusting your filters or increasing your income level.
         """)
         
-        # Show all cards anyway for reference
+        # Show all cards anyway for reference; reuses the cached scores
         st.markdown("### 📚 All Available Cards (for reference)")
-        all_results = rank_cards(
-            cards=all_cards,
-            monthly_salary=10000000,  # High salary to show all
-            monthly_spends=monthly_spends,
-            needs_lounge=False,
-            lifetime_free_only=False,
-            is_first_year=is_first_year,
+        all_results = _cached_rank(
+            10000000,  # High salary to show all
+            spend_vector,
+            False,
+            False,
+            is_first_year,
         )
         display_comparison_table(all_results)
         return
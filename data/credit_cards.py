@@ -8,7 +8,10 @@ Contains detailed information about popular Indian credit cards including:
 - Lounge access
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
+import pandas as pd
 
 # Point valuation rates (₹ per point for different banks)
 POINT_VALUATION = {
@@ -21,6 +24,12 @@ POINT_VALUATION = {
     "IndusInd": 0.50,  # IndusInd points
 }
 
+# Value of one airport lounge visit saved (₹)
+LOUNGE_VALUE_PER_VISIT = 1500
+
+# Spend categories, in the column order used by the card arrays below
+CATEGORIES = ("general", "travel", "dining", "online", "utilities")
+
 # Comprehensive Indian Credit Card Database
 CREDIT_CARDS: List[Dict[str, Any]] = [
     {
@@ -310,26 +319,186 @@ CREDIT_CARDS: List[Dict[str, Any]] = [
 ]
 
 
+def derive_card_fields(card: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the lookup fields derived from a card's source fields
+    - milestone_thresholds: milestone spend thresholds, sorted, as a tuple
+    - milestone_points: bonus points aligned with the thresholds, as a tuple
+    - point_value: ₹ value of one reward point for the card's bank
+    - lounge_annual_value: ₹ value of a year of lounge access
+    The card dict itself is not modified
+    """
+    milestones = sorted(
+        (int(threshold), points) for threshold, points in card["milestone_benefits"].items()
+    )
+    
+    # Unlimited access (999/quarter) is valued as 12 visits a year
+    quarterly_visits = card["lounge_visits_per_quarter"]
+    annual_visits = 12 if quarterly_visits >= 999 else quarterly_visits * 4
+    
+    return {
+        "milestone_thresholds": tuple(m[0] for m in milestones),
+        "milestone_points": tuple(m[1] for m in milestones),
+        "point_value": POINT_VALUATION.get(card["bank"], 0.25),
+        "lounge_annual_value": annual_visits * LOUNGE_VALUE_PER_VISIT,
+    }
+
+
+def card_fields(card: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Derived lookup fields of a card (see derive_card_fields)
+    Catalog cards are served from a table built once at import; any other
+    card dict, including edited copies of catalog cards, is derived afresh
+    """
+    fields = _CATALOG_FIELDS.get(id(card))
+    if fields is None:
+        fields = derive_card_fields(card)
+    return fields
+
+
+def build_card_arrays(cards: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Flatten a list of card dicts into one NumPy array per numeric field
+    Row i of every array describes cards[i]; "category_multipliers" is an
+    (n_cards, len(CATEGORIES)) matrix with the base rate filling any gaps
+    
+    Milestones are flattened into parallel "milestone_*" arrays, one entry
+    per (card, threshold) pair, with "milestone_card_index" pointing back
+    at the owning card's row and "milestone_value" already converted to ₹
+    using the bank's point valuation
+    """
+    derived = [card_fields(card) for card in cards]
+    
+    def column(field: str, dtype) -> np.ndarray:
+        return np.array([card[field] for card in cards], dtype=dtype)
+    
+    milestone_counts = [len(fields["milestone_thresholds"]) for fields in derived]
+    
+    return {
+        "annual_fee": column("annual_fee", np.int64),
+        "fee_waiver_threshold": column("fee_waiver_threshold", np.int64),
+        "min_salary_req": column("min_salary_req", np.int64),
+        "base_reward_rate": column("base_reward_rate", np.float64),
+        "lounge_visits_per_quarter": column("lounge_visits_per_quarter", np.int64),
+        "lounge_value": np.array(
+            [fields["lounge_annual_value"] for fields in derived], dtype=np.float64
+        ),
+        "welcome_benefit": column("welcome_benefit", np.float64),
+        "joining_fee": column("joining_fee", np.int64),
+        "category_multipliers": np.array(
+            [
+                [card["base_reward_rate"]]
+                + [
+                    card["category_multipliers"].get(category, card["base_reward_rate"])
+                    for category in CATEGORIES[1:]
+                ]
+                for card in cards
+            ],
+            dtype=np.float64,
+        ).reshape(len(cards), len(CATEGORIES)),
+        "milestone_card_index": np.repeat(
+            np.arange(len(cards), dtype=np.intp), milestone_counts
+        ),
+        "milestone_threshold": np.array(
+            [threshold for fields in derived for threshold in fields["milestone_thresholds"]],
+            dtype=np.int64,
+        ),
+        # Bank point valuation is fixed, so bonus points are stored as ₹ values
+        "milestone_value": np.array(
+            [
+                points * fields["point_value"]
+                for fields in derived
+                for points in fields["milestone_points"]
+            ],
+            dtype=np.float64,
+        ),
+    }
+
+
+# Derived fields of the catalog cards, keyed by card identity; edited
+# copies of a catalog card are different objects and get derived afresh
+_CATALOG_FIELDS = {id(card): derive_card_fields(card) for card in CREDIT_CARDS}
+
+# Struct-of-arrays view of CREDIT_CARDS, built once at import
+CARD_ARRAYS = build_card_arrays(CREDIT_CARDS)
+
+
+# Column-store view of the scalar card fields, built once at import;
+# row i is CREDIT_CARDS[i]
+CARDS_DF = pd.DataFrame(
+    CREDIT_CARDS,
+    columns=[
+        "card_name",
+        "bank",
+        "card_type",
+        "annual_fee",
+        "fee_waiver_threshold",
+        "min_salary_req",
+        "base_reward_rate",
+        "lounge_access",
+        "lounge_visits_per_quarter",
+        "fuel_surcharge_waiver",
+        "joining_fee",
+        "welcome_benefit",
+        "description",
+    ],
+).astype({
+    "annual_fee": "int64",
+    "fee_waiver_threshold": "int64",
+    "min_salary_req": "int64",
+    "base_reward_rate": "float64",
+    "lounge_visits_per_quarter": "int64",
+    "fuel_surcharge_waiver": "bool",
+    "joining_fee": "int64",
+    "welcome_benefit": "int64",
+})
+
+
+def _select(mask: np.ndarray) -> List[Dict[str, Any]]:
+    """Return the cards whose row is set in a boolean mask over CARD_ARRAYS"""
+    return [CREDIT_CARDS[i] for i in np.flatnonzero(mask)]
+
+
+# The catalog is static, so the fixed filters are precomputed once
+_LIFETIME_FREE_CARDS = tuple(_select(CARD_ARRAYS["annual_fee"] == 0))
+_LOUNGE_CARDS = tuple(_select(CARD_ARRAYS["lounge_visits_per_quarter"] > 0))
+# Cards ordered by salary requirement, so eligibility is a prefix found by
+# binary search; ties keep catalog order
+_SALARY_ORDER = np.argsort(CARD_ARRAYS["min_salary_req"], kind="stable")
+_CARDS_BY_MIN_SALARY = tuple(CREDIT_CARDS[i] for i in _SALARY_ORDER)
+_SORTED_MIN_SALARY = CARD_ARRAYS["min_salary_req"][_SALARY_ORDER]
+_CARDS_BY_BANK = {
+    bank: tuple(card for card in CREDIT_CARDS if card["bank"].lower() == bank)
+    for bank in {card["bank"].lower() for card in CREDIT_CARDS}
+}
+
+
 def get_all_cards() -> List[Dict[str, Any]]:
     """Returns the complete list of credit cards"""
     return CREDIT_CARDS
 
 
-def get_lifetime_free_cards() -> List[Dict[str, Any]]:
+def get_cards_df() -> pd.DataFrame:
+    """Returns the scalar card fields as a DataFrame (shared, do not modify)"""
+    return CARDS_DF
+
+
+def get_lifetime_free_cards() -> Tuple[Dict[str, Any], ...]:
     """Returns only lifetime free cards"""
-    return [card for card in CREDIT_CARDS if card["annual_fee"] == 0]
+    return _LIFETIME_FREE_CARDS
 
 
-def get_cards_by_bank(bank: str) -> List[Dict[str, Any]]:
+def get_cards_by_bank(bank: str) -> Tuple[Dict[str, Any], ...]:
     """Filter cards by bank name"""
-    return [card for card in CREDIT_CARDS if card["bank"].lower() == bank.lower()]
+    return _CARDS_BY_BANK.get(bank.lower(), ())
 
 
-def get_eligible_cards(monthly_salary: int) -> List[Dict[str, Any]]:
-    """Filter cards based on salary eligibility"""
-    return [card for card in CREDIT_CARDS if card["min_salary_req"] <= monthly_salary]
+def get_eligible_cards(monthly_salary: int) -> Tuple[Dict[str, Any], ...]:
+    """Filter cards based on salary eligibility, lowest requirement first"""
+    count = np.searchsorted(_SORTED_MIN_SALARY, monthly_salary, side="right")
+    return _CARDS_BY_MIN_SALARY[:count]
 
 
-def get_cards_with_lounge_access() -> List[Dict[str, Any]]:
+def get_cards_with_lounge_access() -> Tuple[Dict[str, Any], ...]:
     """Returns cards that offer lounge access"""
-    return [card for card in CREDIT_CARDS if card["lounge_visits_per_quarter"] > 0]
+    return _LOUNGE_CARDS
@@ -3,8 +3,84 @@ Credit Card Value Calculator
 The brain of the recommendation engine that calculates net annual benefit
 """
 
-from typing import Dict, Any, List, Tuple
-from data.credit_cards import POINT_VALUATION
+from bisect import bisect_right
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from data.credit_cards import (
+    CARD_ARRAYS,
+    CATEGORIES,
+    CREDIT_CARDS,
+    LOUNGE_VALUE_PER_VISIT,
+    build_card_arrays,
+    card_fields,
+)
+
+# Spends as a {category: amount} dict, or amounts in CATEGORIES order
+Spends = Union[Dict[str, int], Sequence[int]]
+
+
+class Breakdown(NamedTuple):
+    """
+    Detailed breakdown of an eligible card's annual value
+    Collections are tuples so memoized results stay immutable when shared
+    """
+    annual_fee: int
+    effective_fee: int
+    fee_waived: bool
+    total_rewards: float
+    category_rewards: Tuple[Tuple[str, float], ...]  # (category, ₹) in CATEGORIES order
+    milestone_value: float
+    achieved_milestones: Tuple[str, ...]
+    lounge_value: float
+    welcome_value: float
+    gross_benefits: float
+    total_annual_spend: int
+
+
+class CardAnalysis(NamedTuple):
+    """
+    Result of analysing one card for a user profile
+    Ineligible cards only carry the identifying fields and `reason`
+    """
+    card_name: str
+    bank: str
+    is_eligible: bool
+    net_value: float
+    card_type: str = ""
+    effective_reward_rate: float = 0.0
+    breakdown: Optional[Breakdown] = None
+    why_recommended: str = ""
+    lounge_access: str = ""
+    description: str = ""
+    reason: str = ""
+
+
+def _spend_tuple(spends: Spends) -> Tuple[int, ...]:
+    """
+    Spend amounts (monthly or annual) as a tuple in CATEGORIES order
+    Accepts a {category: amount} dict or amounts in CATEGORIES order;
+    dict keys outside CATEGORIES are ignored
+    """
+    if isinstance(spends, dict):
+        return tuple(spends.get(category, 0) for category in CATEGORIES)
+    return tuple(spends)
+
+
+def _annual_spend_vector(monthly_spends: Spends) -> np.ndarray:
+    """Annual spend per category, aligned with the multiplier columns"""
+    if isinstance(monthly_spends, dict):
+        monthly = np.fromiter(
+            (monthly_spends.get(category, 0) for category in CATEGORIES),
+            dtype=np.float64,
+            count=len(CATEGORIES),
+        )
+    else:
+        monthly = np.asarray(monthly_spends, dtype=np.float64)
+    return monthly * 12
 
 
 def calculate_annual_spend(monthly_spends: Dict[str, int]) -> Dict[str, int]:
@@ -17,8 +93,11 @@ def calculate_total_spend(spends: Dict[str, int]) -> int:
     return sum(spends.values())
 
 
-def check_eligibility(card: Dict[str, Any], monthly_salary: int) -> bool:
-    """Check if user is eligible for the card based on salary"""
+def check_eligibility(card: Dict[str, Any], monthly_salary: int) -> Union[bool, np.ndarray]:
+    """
+    Check if user is eligible for the card based on salary
+    Also accepts a card-arrays dict, returning a boolean mask over its cards
+    """
     return monthly_salary >= card["min_salary_req"]
 
 
@@ -27,54 +106,51 @@ def calculate_effective_fee(card: Dict[str, Any], annual_spend: int) -> int:
     Calculate the effective annual fee after considering fee waiver threshold
     Returns 0 if annual spend exceeds the waiver threshold
     """
-    if card["fee_waiver_threshold"] == 0:
-        # Lifetime free card
-        return 0
-    elif annual_spend >= card["fee_waiver_threshold"]:
-        # Fee waived due to spend threshold
-        return 0
-    else:
-        return card["annual_fee"]
+    # Lifetime free cards have a 0 threshold, so only a positive, unmet
+    # threshold leaves the fee in place
+    threshold = card["fee_waiver_threshold"]
+    return card["annual_fee"] if 0 < threshold and annual_spend < threshold else 0
+
+
+def _effective_fee_array(arrays: Dict[str, np.ndarray], annual_spend: float) -> np.ndarray:
+    """calculate_effective_fee for every card of a card-arrays dict at once"""
+    threshold = arrays["fee_waiver_threshold"]
+    return np.where((threshold > 0) & (annual_spend < threshold), arrays["annual_fee"], 0)
 
 
 def calculate_base_rewards(
     card: Dict[str, Any], 
-    annual_spends: Dict[str, int]
-) -> Tuple[float, Dict[str, float]]:
+    annual_spends: Spends
+) -> Tuple[float, List[float], List[float]]:
     """
     Calculate rewards based on base rate and category multipliers
-    Returns total reward value and breakdown by category
+    annual_spends is a {category: amount} dict or amounts in CATEGORIES order;
+    only the CATEGORIES are rewarded, other dict keys are ignored
+    Returns total reward value, rewards per category and the reward rate
+    applied to each category, both aligned with CATEGORIES
     """
-    bank = card["bank"]
-    point_value = POINT_VALUATION.get(bank, 0.25)
-    
-    category_rewards = {}
+    if isinstance(annual_spends, dict):
+        annual_spends = [annual_spends.get(category, 0) for category in CATEGORIES]
+    base_rate = card["base_reward_rate"]
+    multipliers = card["category_multipliers"]
+    category_rewards = []
+    category_rates = []
     total_rewards = 0.0
     
-    # Map user spend categories to card multipliers
-    category_mapping = {
-        "general": "base",
-        "travel": "travel",
-        "dining": "dining",
-        "online": "online",
-        "utilities": "utilities",
-    }
-    
-    for user_category, amount in annual_spends.items():
+    for user_category, amount in zip(CATEGORIES, annual_spends):
         if user_category == "general":
             # Apply base reward rate
-            reward_rate = card["base_reward_rate"]
+            reward_rate = base_rate
         else:
             # Try to get category multiplier, fall back to base rate
-            reward_rate = card["category_multipliers"].get(
-                user_category, card["base_reward_rate"]
-            )
+            reward_rate = multipliers.get(user_category, base_rate)
         
         reward_value = amount * reward_rate
-        category_rewards[user_category] = reward_value
+        category_rates.append(reward_rate)
+        category_rewards.append(reward_value)
         total_rewards += reward_value
     
-    return total_rewards, category_rewards
+    return total_rewards, category_rewards, category_rates
 
 
 def calculate_milestone_benefits(
@@ -85,54 +161,143 @@ def calculate_milestone_benefits(
     Calculate milestone benefits based on annual spend
     Returns total milestone value and list of achieved milestones
     """
-    bank = card["bank"]
-    point_value = POINT_VALUATION.get(bank, 0.25)
+    fields = card_fields(card)
     
-    total_milestone_value = 0.0
-    achieved_milestones = []
+    # Thresholds are sorted, so the achieved milestones are a prefix
+    achieved = bisect_right(fields["milestone_thresholds"], annual_spend)
+    total_milestone_value = sum(fields["milestone_points"][:achieved]) * fields["point_value"]
     
-    for threshold, points in card["milestone_benefits"].items():
-        threshold_int = int(threshold) if isinstance(threshold, str) else threshold
-        if annual_spend >= threshold_int:
-            value = points * point_value
-            total_milestone_value += value
-            achieved_milestones.append(
-                f"₹{threshold_int:,} spend → {points:,} points (₹{value:,.0f})"
-            )
-    
-    return total_milestone_value, achieved_milestones
+    return total_milestone_value, _format_milestones(fields, achieved)
+
+
+def _format_milestones(fields: Dict[str, Any], achieved: int) -> List[str]:
+    """Describe the first `achieved` milestones of a card's derived fields"""
+    if not achieved:
+        return []
+    point_value = fields["point_value"]
+    return [
+        f"₹{threshold:,} spend → {points:,} points (₹{points * point_value:,.0f})"
+        for threshold, points in zip(
+            fields["milestone_thresholds"][:achieved], fields["milestone_points"][:achieved]
+        )
+    ]
+
+
+def _achieved_milestones(card: Dict[str, Any], annual_spend: int) -> List[str]:
+    """Descriptions of the milestones reached at annual_spend, without their value"""
+    fields = card_fields(card)
+    return _format_milestones(fields, bisect_right(fields["milestone_thresholds"], annual_spend))
 
 
 def calculate_lounge_value(card: Dict[str, Any], needs_lounge: bool) -> float:
     """
     Calculate the value of lounge access
-    Assuming ₹1,500 per lounge visit saved
+    Assuming ₹1,500 per lounge visit saved (see derive_card_fields)
     """
     if not needs_lounge:
         return 0.0
     
-    LOUNGE_VALUE_PER_VISIT = 1500  # ₹1,500 per visit
-    quarterly_visits = card["lounge_visits_per_quarter"]
+    return card_fields(card)["lounge_annual_value"]
+
+
+def _build_analysis(
+    card: Dict[str, Any],
+    total_annual_spend: int,
+    effective_fee: int,
+    total_rewards: float,
+    category_rewards: List[float],
+    category_rates: List[float],
+    milestone_value: float,
+    achieved_milestones: List[str],
+    lounge_value: float,
+    welcome_value: float,
+) -> CardAnalysis:
+    """
+    Assemble the analysis for an eligible card from its computed values
+    Shared by calculate_net_value and the vectorized rank_cards;
+    category_rewards and category_rates are aligned with CATEGORIES
+    """
+    annual_fee = card["annual_fee"]
+    fee_waived = effective_fee == 0 and annual_fee > 0
+    
+    # Calculate net value
+    gross_benefits = total_rewards + milestone_value + lounge_value + welcome_value
+    net_value = gross_benefits - effective_fee
+    
+    # Calculate effective reward rate
+    effective_reward_rate = (total_rewards / total_annual_spend * 100) if total_annual_spend > 0 else 0
+    
+    # Generate recommendation reason
+    reasons = []
+    
+    # Find the best category (first one wins ties)
+    if category_rewards:
+        best_category_value = max(category_rewards)
+        if best_category_value > 0:
+            best_index = category_rewards.index(best_category_value)
+            rate = category_rates[best_index]
+            reasons.append(f"{rate*100:.1f}% rewards on {CATEGORIES[best_index]} spend")
+    
+    if fee_waived:
+        reasons.append(f"Fee waived (spend > ₹{card['fee_waiver_threshold']:,})")
+    elif annual_fee == 0:
+        reasons.append("Lifetime free card")
     
-    if quarterly_visits >= 999:  # Unlimited
-        # Assume 12 visits per year for unlimited
-        return 12 * LOUNGE_VALUE_PER_VISIT
+    if achieved_milestones:
+        reasons.append(f"{len(achieved_milestones)} milestone benefit(s) achieved")
     
-    annual_visits = quarterly_visits * 4
-    return annual_visits * LOUNGE_VALUE_PER_VISIT
+    if lounge_value > 0:
+        if card["lounge_visits_per_quarter"] >= 999:
+            reasons.append("Unlimited lounge access")
+        else:
+            # Visits the lounge value was computed from
+            visits = round(lounge_value / LOUNGE_VALUE_PER_VISIT)
+            reasons.append(f"{visits} lounge visits/year")
+    
+    why_recommended = " | ".join(reasons) if reasons else "Basic rewards on all spends"
+    category_rewards = tuple(zip(CATEGORIES, category_rewards))
+    achieved_milestones = tuple(achieved_milestones)
+    
+    # Records are built positionally (local names match the field names);
+    # keyword construction of a NamedTuple costs about twice as much
+    breakdown = Breakdown(
+        annual_fee,
+        effective_fee,
+        fee_waived,
+        total_rewards,
+        category_rewards,
+        milestone_value,
+        achieved_milestones,
+        lounge_value,
+        welcome_value,
+        gross_benefits,
+        total_annual_spend,
+    )
+    return CardAnalysis(
+        card["card_name"],
+        card["bank"],
+        True,
+        net_value,
+        card["card_type"],
+        effective_reward_rate,
+        breakdown,
+        why_recommended,
+        card["lounge_access"],
+        card["description"],
+    )
 
 
 def calculate_net_value(
     card: Dict[str, Any],
     monthly_salary: int,
-    monthly_spends: Dict[str, int],
+    monthly_spends: Spends,
     needs_lounge: bool = False,
     is_first_year: bool = False,
-) -> Dict[str, Any]:
+) -> CardAnalysis:
     """
     Main calculation function that computes the net annual benefit
     
-    Returns a dictionary with:
+    Returns a CardAnalysis with:
     - is_eligible: Boolean
     - net_value: Net annual benefit (rewards - fees)
     - breakdown: Detailed breakdown of all components
@@ -142,25 +307,35 @@ def calculate_net_value(
     is_eligible = check_eligibility(card, monthly_salary)
     
     if not is_eligible:
-        return {
-            "card_name": card["card_name"],
-            "bank": card["bank"],
-            "is_eligible": False,
-            "net_value": 0,
-            "reason": f"Requires minimum salary of ₹{card['min_salary_req']:,}/month",
-            "breakdown": {},
-        }
-    
-    # Calculate annual spends
-    annual_spends = calculate_annual_spend(monthly_spends)
-    total_annual_spend = calculate_total_spend(annual_spends)
+        return CardAnalysis(
+            card_name=card["card_name"],
+            bank=card["bank"],
+            is_eligible=False,
+            net_value=0,
+            reason=f"Requires minimum salary of ₹{card['min_salary_req']:,}/month",
+        )
     
+    # Calculate annual spends, once as a list aligned with CATEGORIES
+    annual_spends = [amount * 12 for amount in _spend_tuple(monthly_spends)]
+    
+    return _analyse_card(card, annual_spends, sum(annual_spends), needs_lounge, is_first_year)
+
+
+def _analyse_card(
+    card: Dict[str, Any],
+    annual_spends: List[int],
+    total_annual_spend: int,
+    needs_lounge: bool,
+    is_first_year: bool,
+) -> CardAnalysis:
+    """calculate_net_value for an eligible card, given its annual spends"""
     # Calculate effective fee
     effective_fee = calculate_effective_fee(card, total_annual_spend)
-    fee_waived = effective_fee == 0 and card["annual_fee"] > 0
     
     # Calculate rewards
-    total_rewards, category_rewards = calculate_base_rewards(card, annual_spends)
+    total_rewards, category_rewards, category_rates = calculate_base_rewards(
+        card, annual_spends
+    )
     
     # Calculate milestone benefits
     milestone_value, achieved_milestones = calculate_milestone_benefits(
@@ -173,100 +348,261 @@ def calculate_net_value(
     # Welcome benefit (first year only)
     welcome_value = card["welcome_benefit"] if is_first_year else 0
     
-    # Calculate net value
-    gross_benefits = total_rewards + milestone_value + lounge_value + welcome_value
-    net_value = gross_benefits - effective_fee
-    
-    # Calculate effective reward rate
-    effective_reward_rate = (total_rewards / total_annual_spend * 100) if total_annual_spend > 0 else 0
-    
-    # Generate recommendation reason
-    reasons = []
-    
-    # Find the best category
-    if category_rewards:
-        best_category = max(category_rewards, key=category_rewards.get)
-        best_category_value = category_rewards[best_category]
-        if best_category_value > 0:
-            rate = card["category_multipliers"].get(best_category, card["base_reward_rate"])
-            reasons.append(f"{rate*100:.1f}% rewards on {best_category} spend")
+    return _build_analysis(
+        card,
+        total_annual_spend,
+        effective_fee,
+        total_rewards,
+        category_rewards,
+        category_rates,
+        milestone_value,
+        achieved_milestones,
+        lounge_value,
+        welcome_value,
+    )
+
+
+def _score_cards(
+    arrays: Dict[str, np.ndarray],
+    annual_spend_vec: np.ndarray,
+    is_first_year: bool,
+) -> Dict[str, np.ndarray]:
+    """
+    Scoring kernel: compute every value component for all cards at once
+    Returns arrays aligned with the rows of `arrays`; lounge value is the
+    precomputed per-card constant, only counted by rank_cards when lounge
+    access is needed
+    """
+    n_cards = len(arrays["annual_fee"])
+    total_annual_spend = annual_spend_vec.sum()
     
-    if fee_waived:
-        reasons.append(f"Fee waived (spend > ₹{card['fee_waiver_threshold']:,})")
-    elif card["annual_fee"] == 0:
-        reasons.append("Lifetime free card")
+    # Base rewards for every card in one matrix-vector product
+    annual_rewards = arrays["category_multipliers"] @ annual_spend_vec
     
-    if achieved_milestones:
-        reasons.append(f"{len(achieved_milestones)} milestone benefit(s) achieved")
+    effective_fee = _effective_fee_array(arrays, total_annual_spend)
     
-    if lounge_value > 0:
-        visits = card["lounge_visits_per_quarter"] * 4
-        if card["lounge_visits_per_quarter"] >= 999:
-            reasons.append("Unlimited lounge access")
-        else:
-            reasons.append(f"{visits} lounge visits/year")
+    # Milestones: mask every (card, threshold) row at once, then scatter-add
+    # the bonus value of the reached ones back onto their cards
+    reached = arrays["milestone_threshold"] <= total_annual_spend
+    milestone_value = np.bincount(
+        arrays["milestone_card_index"],
+        weights=np.where(reached, arrays["milestone_value"], 0.0),
+        minlength=n_cards,
+    ).astype(np.float64, copy=False)  # bincount of no milestones yields ints
     
     return {
-        "card_name": card["card_name"],
-        "bank": card["bank"],
-        "card_type": card["card_type"],
-        "is_eligible": True,
-        "net_value": net_value,
-        "effective_reward_rate": effective_reward_rate,
-        "breakdown": {
-            "annual_fee": card["annual_fee"],
-            "effective_fee": effective_fee,
-            "fee_waived": fee_waived,
-            "total_rewards": total_rewards,
-            "category_rewards": category_rewards,
-            "milestone_value": milestone_value,
-            "achieved_milestones": achieved_milestones,
-            "lounge_value": lounge_value,
-            "welcome_value": welcome_value,
-            "gross_benefits": gross_benefits,
-            "total_annual_spend": total_annual_spend,
-        },
-        "why_recommended": " | ".join(reasons) if reasons else "Basic rewards on all spends",
-        "lounge_access": card["lounge_access"],
-        "description": card["description"],
+        "annual_rewards": annual_rewards,
+        "milestone_value": milestone_value,
+        "lounge_value": arrays["lounge_value"],
+        "welcome_value": arrays["welcome_benefit"] * is_first_year,
+        "effective_fee": effective_fee,
     }
 
 
+def score_cards(
+    cards: List[Dict[str, Any]],
+    monthly_spends: Spends,
+    is_first_year: bool = False,
+) -> Dict[str, np.ndarray]:
+    """
+    Score every card in `cards` for a spending profile, ignoring eligibility
+    and preference filters. The result can be passed to rank_cards as
+    `scores` so several rankings over the same profile share one scoring pass
+    """
+    arrays = CARD_ARRAYS if cards is CREDIT_CARDS else build_card_arrays(cards)
+    return _score_cards(arrays, _annual_spend_vector(monthly_spends), is_first_year)
+
+
 def rank_cards(
     cards: List[Dict[str, Any]],
     monthly_salary: int,
-    monthly_spends: Dict[str, int],
+    monthly_spends: Spends,
     needs_lounge: bool = False,
     lifetime_free_only: bool = False,
     is_first_year: bool = False,
-) -> List[Dict[str, Any]]:
+    scores: Optional[Dict[str, np.ndarray]] = None,
+    top_k: Optional[int] = None,
+) -> List[CardAnalysis]:
     """
     Rank all cards based on net value for the user's profile
-    Returns sorted list of card analysis results
+    Returns sorted list of CardAnalysis results
+    
+    Cards are scored one by one in plain Python, which is fastest for a
+    catalog this size. With `scores` from score_cards (same cards, spends
+    and is_first_year), or `top_k` on the catalog, the cards are instead
+    filtered and ordered over the struct-of-arrays card columns and results
+    are assembled only for the returned rows
+    
+    With `top_k`, only the best `top_k` cards are returned; a negative
+    `top_k` raises ValueError
+    
+    Rankings of the built-in catalog are memoized on the inputs; the
+    (frozen) results are shared between calls
     """
-    results = []
+    if top_k is not None and top_k < 0:
+        raise ValueError(f"top_k must be non-negative, got {top_k}")
     
-    for card in cards:
-        # Filter for lifetime free if requested
-        if lifetime_free_only and card["annual_fee"] > 0:
-            continue
-        
-        # Filter for lounge access if required
-        if needs_lounge and card["lounge_visits_per_quarter"] == 0:
-            continue
-        
-        analysis = calculate_net_value(
-            card=card,
-            monthly_salary=monthly_salary,
-            monthly_spends=monthly_spends,
-            needs_lounge=needs_lounge,
-            is_first_year=is_first_year,
+    if cards is CREDIT_CARDS and scores is None:
+        return list(_rank_catalog_cached(
+            monthly_salary,
+            _spend_tuple(monthly_spends),
+            needs_lounge,
+            lifetime_free_only,
+            is_first_year,
+            top_k,
+        ))
+    
+    return _rank_cards(
+        cards,
+        monthly_salary,
+        monthly_spends,
+        needs_lounge,
+        lifetime_free_only,
+        is_first_year,
+        scores,
+        top_k,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _rank_catalog_cached(
+    monthly_salary: int,
+    monthly_spends: Tuple[int, ...],
+    needs_lounge: bool,
+    lifetime_free_only: bool,
+    is_first_year: bool,
+    top_k: Optional[int],
+) -> Tuple[CardAnalysis, ...]:
+    """Memoized ranking of CREDIT_CARDS, keyed on the hashable inputs"""
+    return tuple(_rank_cards(
+        CREDIT_CARDS,
+        monthly_salary,
+        monthly_spends,
+        needs_lounge,
+        lifetime_free_only,
+        is_first_year,
+        None,
+        top_k,
+    ))
+
+
+def _rank_cards(
+    cards: List[Dict[str, Any]],
+    monthly_salary: int,
+    monthly_spends: Spends,
+    needs_lounge: bool,
+    lifetime_free_only: bool,
+    is_first_year: bool,
+    scores: Optional[Dict[str, np.ndarray]],
+    top_k: Optional[int],
+) -> List[CardAnalysis]:
+    """Uncached implementation of rank_cards"""
+    if scores is None and (top_k is None or cards is not CREDIT_CARDS):
+        # At this catalog size, scoring card by card in plain Python is
+        # faster than the array kernel plus its conversions, unless only
+        # the top_k rows need assembling; a one-off list would also need
+        # its card arrays built first
+        return _rank_card_list(
+            cards,
+            monthly_salary,
+            monthly_spends,
+            needs_lounge,
+            lifetime_free_only,
+            is_first_year,
+            top_k,
         )
-        
-        if analysis["is_eligible"]:
-            results.append(analysis)
     
-    # Sort by net value (descending)
-    results.sort(key=lambda x: x["net_value"], reverse=True)
+    arrays = CARD_ARRAYS if cards is CREDIT_CARDS else build_card_arrays(cards)
+    annual_spends = [amount * 12 for amount in _spend_tuple(monthly_spends)]
+    annual_spend_vec = np.array(annual_spends, dtype=np.float64)
+    total_annual_spend = sum(annual_spends)
+    
+    # The whole catalog is scored; copying out the eligible cards' columns
+    # first would cost more than it saves
+    if scores is None:
+        scores = _score_cards(arrays, annual_spend_vec, is_first_year)
+    
+    # Eligibility and preference filters
+    mask = check_eligibility(arrays, monthly_salary)
+    if lifetime_free_only:
+        mask &= arrays["annual_fee"] == 0
+    if needs_lounge:
+        mask &= arrays["lounge_visits_per_quarter"] != 0
+    eligible = np.flatnonzero(mask)
+    
+    net_value = (
+        scores["annual_rewards"]
+        + scores["milestone_value"]
+        + scores["welcome_value"]
+        - scores["effective_fee"]
+    )
+    if needs_lounge:
+        net_value += scores["lounge_value"]
+    
+    # Sort by net value (descending); stable so ties keep catalog order
+    neg_net_value = -net_value[eligible]
+    if top_k is not None and 0 < top_k < len(neg_net_value):
+        # Partial selection: only cards scoring at least the top_k-th best
+        # value (ties included, so the stable order is kept) get sorted
+        kth_value = np.partition(neg_net_value, top_k - 1)[top_k - 1]
+        candidates = np.flatnonzero(neg_net_value <= kth_value)
+        order = candidates[np.argsort(neg_net_value[candidates], kind="stable")[:top_k]]
+    else:
+        order = np.argsort(neg_net_value, kind="stable")[:top_k]
+    ranked = eligible[order]
+    
+    # Materialize the ranked rows as Python values in bulk, one conversion
+    # per column instead of per-card NumPy scalar access
+    category_rates = arrays["category_multipliers"][ranked]
+    category_rewards = (category_rates * annual_spend_vec).tolist()
+    category_rates = category_rates.tolist()
+    effective_fee = scores["effective_fee"][ranked].tolist()
+    annual_rewards = scores["annual_rewards"][ranked].tolist()
+    milestone_value = scores["milestone_value"][ranked].tolist()
+    lounge_value = (
+        scores["lounge_value"][ranked].tolist() if needs_lounge else [0.0] * len(ranked)
+    )
+    
+    results = []
+    for rank, i in enumerate(ranked.tolist()):
+        card = cards[i]
+        results.append(_build_analysis(
+            card,
+            total_annual_spend,
+            effective_fee[rank],
+            annual_rewards[rank],
+            category_rewards[rank],
+            category_rates[rank],
+            milestone_value[rank],
+            _achieved_milestones(card, total_annual_spend),
+            lounge_value[rank],
+            card["welcome_benefit"] if is_first_year else 0,
+        ))
     
     return results
+
+
+def _rank_card_list(
+    cards: List[Dict[str, Any]],
+    monthly_salary: int,
+    monthly_spends: Spends,
+    needs_lounge: bool,
+    lifetime_free_only: bool,
+    is_first_year: bool,
+    top_k: Optional[int],
+) -> List[CardAnalysis]:
+    """rank_cards for a card list other than the catalog, one card at a time"""
+    annual_spends = [amount * 12 for amount in _spend_tuple(monthly_spends)]
+    total_annual_spend = sum(annual_spends)
+    
+    results = [
+        _analyse_card(card, annual_spends, total_annual_spend, needs_lounge, is_first_year)
+        for card in cards
+        if check_eligibility(card, monthly_salary)
+        and not (lifetime_free_only and card["annual_fee"] > 0)
+        and not (needs_lounge and card["lounge_visits_per_quarter"] == 0)
+    ]
+    
+    # Sort by net value (descending); stable so ties keep list order
+    results.sort(key=attrgetter("net_value"), reverse=True)
+    return results[:top_k]